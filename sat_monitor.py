@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 import requests
-from bs4 import BeautifulSoup, Comment
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import logging
+from logging.handlers import RotatingFileHandler
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import hashlib
 import re
 
@@ -15,7 +18,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("sat_monitor.log"),
+        RotatingFileHandler("sat_monitor.log", maxBytes=1_000_000, backupCount=3),
         logging.StreamHandler()
     ]
 )
@@ -28,168 +31,290 @@ TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "-1002594329611")
 DATE_THRESHOLD = 7  # Alert if more than this many dates are found
 STATE_FILE = "sat_monitor_state.json"  # File to store the last state
-
-
-def clean_html_for_hash(html_content: str) -> str:
-    """
-    Clean the HTML content to remove elements that might change frequently
-    but don't affect the actual content we care about.
+# Seconds between polls when running as a long-lived process; 0 keeps the
+# single-shot behavior for cron / GitHub Actions
+POLL_INTERVAL = int(os.environ.get("POLL_INTERVAL", "0"))
+# Bounds for the adaptive poll delay derived from observed change history
+MIN_POLL = 300
+MAX_POLL = 86400
+CHANGE_HISTORY_LIMIT = 50  # Timestamps of past changes kept in state
+
+# Shared session so the fetch and both webhook posts reuse pooled TCP/TLS
+# connections instead of doing a fresh handshake per call. All retrying
+# lives here: urllib3 honors Retry-After on 429 by default and the jitter
+# keeps concurrent retriers from thundering in lockstep. POST is in
+# allowed_methods because the webhook sends are idempotent enough (a rare
+# duplicate alert beats a dropped one).
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "POST"]
+    )
+))
+
+
+def calculate_dates_hash(test_dates: List[str]) -> str:
+    """Fingerprint the extracted date list.
+
+    The signal this monitor cares about is "did the list of test dates
+    change", so the persisted content_hash is computed over the semantic
+    content rather than the page markup.
     """
-    try:
-        # Parse the HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Remove common dynamic elements
-
-        # 1. Remove all script tags (JavaScript can contain timestamps, random values, etc.)
-        for script in soup.find_all('script'):
-            script.decompose()
-
-        # 2. Remove all style tags (CSS can change without affecting content)
-        for style in soup.find_all('style'):
-            style.decompose()
-
-        # 3. Remove comments (may contain build info, timestamps)
-        for comment in soup.find_all(text=lambda text: isinstance(text, Comment)):
-            comment.extract()
-
-        # 4. Remove meta tags (often contain dynamic content)
-        for meta in soup.find_all('meta'):
-            meta.decompose()
+    return hashlib.blake2b('|'.join(test_dates).encode('utf-8'), digest_size=16).hexdigest()
 
-        # 6. Convert the cleaned soup back to string
-        cleaned_html = str(soup)
-
-        # 7. Remove whitespace variations
-        cleaned_html = re.sub(r'\s+', ' ', cleaned_html)
-
-        return cleaned_html
-    except Exception as e:
-        logger.error(f"Error cleaning HTML for hash: {e}")
-        # Fall back to original content if cleaning fails
-        return html_content
 
+def calculate_table_hash(html_content: bytes) -> Optional[str]:
+    """Hash just the dates-table slice so extraction can be skipped when
+    the table itself is byte-identical to the previous run."""
+    table_match = _TABLE_RE.search(html_content)
+    if not table_match:
+        return None
+    return hashlib.blake2b(table_match.group(0), digest_size=16).hexdigest()
 
-def calculate_content_hash(text: str) -> str:
-    """Calculate MD5 hash of the content"""
-    # First clean the HTML to remove dynamic elements
-    cleaned_text = clean_html_for_hash(text)
-    logger.info(f"Original text length: {len(text)}, Cleaned text length: {len(cleaned_text)}")
-    return hashlib.md5(cleaned_text.encode('utf-8')).hexdigest()
 
+def fetch_page(prev_modified: Optional[str] = None,
+               prev_etag: Optional[str] = None,
+               prev_raw_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fetch the SAT dates page using requests.
 
-def fetch_page() -> Optional[Dict[str, str]]:
-    """Fetch the SAT dates page using requests and capture content hash"""
-    logger.info(f"Fetching {URL}")
+    If prev_modified and/or prev_etag are given, they are sent as
+    If-Modified-Since / If-None-Match so the server can answer 304 and we
+    skip downloading and parsing an unchanged page. prev_raw_hash catches
+    the same case when the validators are missing or ignored: identical
+    raw bytes mean parsing can be skipped entirely.
+    """
+    logger.info("Fetching %s", URL)
+
+    # Add headers to mimic a browser
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Cache-Control': 'no-cache',
+        'Pragma': 'no-cache'
+    }
 
-    # Add retry mechanism for robustness
-    max_retries = 3
-    retry_delay = 5  # seconds
+    # Ask for a conditional response when we know the previous
+    # Last-Modified / ETag values
+    if prev_etag:
+        headers['If-None-Match'] = prev_etag
+    if prev_modified and prev_modified != 'N/A':
+        headers['If-Modified-Since'] = prev_modified
 
-    for attempt in range(max_retries):
+        # Cheap headers-only probe first: if Last-Modified still matches,
+        # we can skip the full GET without trusting the server to honor
+        # If-Modified-Since
         try:
-            # Add headers to mimic a browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            }
-
-            # Make the request with a longer timeout
-            response = requests.get(URL, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            # Calculate content hash on cleaned HTML
-            content_hash = calculate_content_hash(response.text)
-            logger.info(f"Page content MD5 hash (after cleaning): {content_hash}")
+            head = SESSION.head(URL, headers=headers, timeout=10, allow_redirects=True)
+            if head.ok and head.headers.get('Last-Modified') == prev_modified:
+                logger.info("HEAD probe shows Last-Modified unchanged, skipping GET")
+                return {
+                    'not_modified': True,
+                    'last_modified': prev_modified,
+                    'status_code': head.status_code
+                }
+        except requests.exceptions.RequestException as e:
+            logger.warning("HEAD probe failed (%s), falling back to GET", e)
 
-            # Still log Last-Modified for reference
-            last_modified = response.headers.get('Last-Modified', 'N/A')
-            logger.info(f"Page Last-Modified: {last_modified}")
+    # Retries (including backoff and Retry-After handling) are configured
+    # on the session adapter, so one request call is all that is needed
+    try:
+        # Make the request with a longer timeout, streaming the body so
+        # receive overlaps with buffering instead of blocking on the
+        # full download first
+        response = SESSION.get(URL, headers=headers, timeout=30, stream=True)
+
+        # Server says nothing changed since prev_modified: no body to
+        # hash or parse
+        if response.status_code == 304:
+            logger.info("Page not modified since last check (HTTP 304), skipping download")
+            return {
+                'not_modified': True,
+                'last_modified': prev_modified,
+                'etag': prev_etag,
+                'status_code': response.status_code
+            }
 
-            logger.info(f"Successfully fetched page with status code: {response.status_code}")
+        response.raise_for_status()
+
+        # Drain the stream in chunks rather than materializing the body
+        # in one shot, feeding the raw-bytes hasher as chunks arrive so
+        # the fingerprint costs no second pass over the body
+        hasher = hashlib.blake2b(digest_size=16)
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            hasher.update(chunk)
+            body.extend(chunk)
+
+        # Cheap fingerprint of the raw bytes: if they match the last
+        # run exactly, there is nothing to parse
+        raw_hash = hasher.hexdigest()
+        if prev_raw_hash and raw_hash == prev_raw_hash:
+            logger.info("Raw page bytes unchanged (hash match), skipping parse")
+            # Report the response's validators, not the previous ones:
+            # servers routinely rotate Last-Modified/ETag over identical
+            # bytes, and the stale values would make every later
+            # conditional request miss
             return {
-                'content': response.text,
-                'content_hash': content_hash,
-                'last_modified': last_modified,
+                'not_modified': True,
+                'last_modified': response.headers.get('Last-Modified') or prev_modified,
+                'etag': response.headers.get('ETag') or prev_etag,
+                'raw_hash': raw_hash,
                 'status_code': response.status_code
             }
 
-        except requests.exceptions.RequestException as e:
-            attempt_num = attempt + 1
-            if attempt_num < max_retries:
-                logger.warning(f"Attempt {attempt_num}/{max_retries} failed: {e}. Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"All {max_retries} attempts failed to fetch the page: {e}")
-                return None
+        # Keep the body as bytes end-to-end: lxml and bs4 both take
+        # bytes (and sniff the declared encoding themselves), so there
+        # is no need for a full-size str twin of the page
+        html_content = bytes(body)
+
+        # Still log Last-Modified for reference
+        last_modified = response.headers.get('Last-Modified', 'N/A')
+        logger.info("Page Last-Modified: %s", last_modified)
+
+        logger.info("Successfully fetched page with status code: %s", response.status_code)
+        return {
+            'content': html_content,
+            'last_modified': last_modified,
+            'etag': response.headers.get('ETag'),
+            'raw_hash': raw_hash,
+            'content_length': response.headers.get('Content-Length'),
+            'status_code': response.status_code
+        }
 
-    return None
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch the page after retries: %s", e)
+        return None
 
 
 def load_state() -> Optional[Dict[str, Union[str, int, List[str]]]]:
     """Load the previous state from file"""
     try:
         if os.path.exists(STATE_FILE):
-            with open(STATE_FILE, 'r', encoding='utf-8') as f:
-                state = json.load(f)
-            logger.info(f"Loaded state from {STATE_FILE}")
+            with open(STATE_FILE, 'rb') as f:
+                state = orjson.loads(f.read())
+            logger.info("Loaded state from %s", STATE_FILE)
             # Don't log the entire state as it might contain sensitive data
-            logger.info(f"State contains {len(state)} keys")
+            logger.info("State contains %d keys", len(state))
             return state
         else:
-            logger.info(f"No state file found at {STATE_FILE}, will create a new one")
+            logger.info("No state file found at %s, will create a new one", STATE_FILE)
             return None
-    except json.JSONDecodeError as e:
-        logger.error(f"Error parsing state file (corrupted JSON): {e}")
+    except orjson.JSONDecodeError as e:
+        logger.error("Error parsing state file (corrupted JSON): %s", e)
         # Rename the corrupted file for debugging
         backup_name = f"{STATE_FILE}.corrupted.{int(time.time())}"
         try:
             os.rename(STATE_FILE, backup_name)
-            logger.info(f"Renamed corrupted state file to {backup_name}")
+            logger.info("Renamed corrupted state file to %s", backup_name)
         except Exception as rename_err:
-            logger.error(f"Failed to rename corrupted state file: {rename_err}")
+            logger.error("Failed to rename corrupted state file: %s", rename_err)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error loading state: {e}")
+        logger.error("Unexpected error loading state: %s", e)
         return None
 
 
-def save_state(content_hash: str, test_dates: List[str], last_modified: Optional[str] = None) -> None:
+def save_state(content_hash: str, test_dates: List[str], last_modified: Optional[str] = None,
+               table_hash: Optional[str] = None, checked_at: Optional[str] = None,
+               change_history: Optional[List[str]] = None,
+               content_length: Optional[str] = None,
+               etag: Optional[str] = None,
+               raw_hash: Optional[str] = None) -> None:
     logger.info("Attempting to execute save_state function...")
     state = {
         "content_hash": content_hash,
         "test_date_count": len(test_dates),
-        "test_dates": test_dates
+        "test_dates": test_dates,
+        "last_modified": last_modified,
+        "table_hash": table_hash,
+        "last_check": checked_at,
+        "change_history": change_history or [],
+        "content_length": content_length,
+        "etag": etag,
+        "raw_hash": raw_hash
     }
-    logger.info(f"Saving state with content hash: {content_hash}")
+    logger.info("Saving state with content hash: %s", content_hash)
 
     try:
         temp_file = f"{STATE_FILE}.tmp"
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        with open(temp_file, 'wb') as f:
+            f.write(orjson.dumps(state))
+            # Make sure the bytes are on disk before the rename makes them
+            # the state file
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(temp_file, STATE_FILE)
-        logger.info(f"Successfully saved state to {STATE_FILE} via os.replace")
+        logger.info("Successfully saved state to %s via os.replace", STATE_FILE)
     except Exception as e:
-        logger.error(f"Error saving state in save_state function: {e}")
+        logger.error("Error saving state in save_state function: %s", e)
 
 
-def extract_test_dates(html_content: str) -> List[str]:
-    """Extract the current test dates from the table using BeautifulSoup"""
+# The dates table has a fixed structure, so a scoped regex can pull the
+# date cells without building any DOM at all
+_TABLE_RE = re.compile(
+    rb'<table[^>]*class="[^"]*cb-table[^"]*"[^>]*>(.*?)</table>', re.DOTALL)
+_DIGIT_RE = re.compile(r'\d')
+
+
+def extract_test_dates(html_content: bytes) -> List[str]:
+    """Extract the current test dates from the table.
+
+    Selects the date cells with a single lxml XPath call; falls back to
+    the BeautifulSoup walk if the markup no longer matches.
+    """
     if not html_content:
         return []
 
+    # Imported here so runs that stop at the not-modified or table-hash
+    # gates never pay for loading the HTML parsing stack
+    from lxml import html as lxml_html
+
     try:
-        # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = lxml_html.fromstring(html_content)
+        # Require both classes so a second cb-table elsewhere on the page
+        # cannot leak rows into the result, mirroring the fallback's scoping
+        cells = doc.xpath(
+            "//table[contains(@class, 'cb-table') and "
+            "contains(@class, 'cb-no-margin-top')]//tr/th[@scope='row']")
+        test_dates = []
+        for cell in cells:
+            text = cell.text_content().strip()
+            if text and _DIGIT_RE.search(text):
+                test_dates.append(text)
+        if test_dates:
+            logger.info("Found %d test dates", len(test_dates))
+            return test_dates
+        logger.warning("XPath fast path matched no date cells, falling back to BeautifulSoup")
+    except Exception as e:
+        logger.warning("XPath extraction failed (%s), falling back to BeautifulSoup", e)
+
+    return _extract_test_dates_soup(html_content)
+
+
+def _extract_test_dates_soup(html_content: bytes) -> List[str]:
+    """BeautifulSoup fallback for when the XPath fast path comes up empty"""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    try:
+        # Parse only the target table with the C-based lxml parser instead
+        # of building a full DOM of the page in pure Python
+        strainer = SoupStrainer('table', class_='cb-table cb-no-margin-top')
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=strainer)
 
         # Find the table with the specific class
-        table = soup.find('table', class_='cb-table cb-no-margin-top')
+        table = soup.find('table')
 
         if not table:
             # Try alternative selectors if the table class changed
+            soup = BeautifulSoup(html_content, 'lxml')
             tables = soup.find_all('table')
             if tables:
                 logger.warning("Could not find table with expected class, trying alternative tables")
@@ -203,29 +328,45 @@ def extract_test_dates(html_content: str) -> List[str]:
             logger.warning("Could not find any table that might contain SAT dates")
             return []
 
-        # Find all rows in the table
-        rows = table.find_all('tr')
-
-        # Extract dates from the first column, excluding the header row
+        # Extract dates from the first column; the header row has no
+        # scope="row" cell so soupsieve's compiled matcher skips it for us
         test_dates: List[str] = []
-        for row in rows[1:]:  # Skip the header row
-            # Find the first th element (date column)
-            date_cell = row.find('th', scope='row')
-            if date_cell and date_cell.text.strip() and any(char.isdigit() for char in date_cell.text):
-                test_dates.append(date_cell.text.strip())
+        for date_cell in table.select('tr > th[scope="row"]'):
+            text = date_cell.get_text(strip=True)
+            if text and _DIGIT_RE.search(text):
+                test_dates.append(text)
 
-        logger.info(f"Found {len(test_dates)} test dates")
+        logger.info("Found %d test dates", len(test_dates))
         return test_dates
     except Exception as e:
-        logger.error(f"Error extracting test dates: {e}")
+        logger.error("Error extracting test dates: %s", e)
         return []
 
 
+def _post_json(url: str, payload: Dict) -> requests.Response:
+    """POST a JSON payload through the shared session.
+
+    Retries for 429 (honoring Retry-After), 5xx and connection errors are
+    handled by the session adapter's urllib3 Retry, so a single call is
+    enough. Raises requests.RequestException once retries are exhausted.
+    """
+    response = SESSION.post(
+        url,
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+        timeout=10
+    )
+    response.raise_for_status()
+    return response
+
+
 def send_discord_notification(
         test_dates: List[str],
         page_changed: bool = False,
         content_hash: Optional[str] = None,
-        prev_hash: Optional[str] = None
+        prev_hash: Optional[str] = None,
+        check_time: Optional[str] = None,
+        bullets: Optional[str] = None
 ) -> bool:
     """Send notification to Discord webhook"""
     if not DISCORD_WEBHOOK_URL:
@@ -241,7 +382,10 @@ def send_discord_notification(
 
     notification_text = " and ".join(notification_reason)
 
-    logger.info(f"Sending Discord notification: {notification_text}")
+    if bullets is None:
+        bullets = "\n".join("• " + date for date in test_dates)
+
+    logger.info("Sending Discord notification: %s", notification_text)
 
     try:
         # Create message payload
@@ -253,12 +397,12 @@ def send_discord_notification(
                 "fields": [
                     {
                         "name": "Current Test Dates",
-                        "value": "\n".join([f"• {date}" for date in test_dates]) or "No dates found",
+                        "value": bullets or "No dates found",
                         "inline": False
                     },
                     {
                         "name": "Check Time",
-                        "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "value": check_time or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                         "inline": False
                     }
                 ],
@@ -290,28 +434,16 @@ def send_discord_notification(
             "inline": False
         })
 
-        # Send notification with retry logic
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    DISCORD_WEBHOOK_URL,
-                    json=message,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10
-                )
-                response.raise_for_status()
-                logger.info(f"Discord notification sent successfully (status code {response.status_code})")
-                return True
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Discord notification attempt {attempt + 1} failed: {e}. Retrying...")
-                    time.sleep(2)  # Wait before retry
-                else:
-                    logger.error(f"All Discord notification attempts failed: {e}")
-                    return False
+        # Send notification, retrying on rate limits and transient errors
+        try:
+            response = _post_json(DISCORD_WEBHOOK_URL, message)
+            logger.info("Discord notification sent successfully (status code %s)", response.status_code)
+            return True
+        except requests.RequestException as e:
+            logger.error("All Discord notification attempts failed: %s", e)
+            return False
     except Exception as e:
-        logger.error(f"Error sending Discord notification: {e}")
+        logger.error("Error sending Discord notification: %s", e)
         return False
 
 
@@ -319,7 +451,9 @@ def send_telegram_notification(
         test_dates: List[str],
         page_changed: bool = False,
         content_hash: Optional[str] = None,
-        prev_hash: Optional[str] = None
+        prev_hash: Optional[str] = None,
+        check_time: Optional[str] = None,
+        bullets: Optional[str] = None
 ) -> bool:
     """Send notification to Telegram channel"""
     if not TELEGRAM_BOT_TOKEN:
@@ -335,35 +469,31 @@ def send_telegram_notification(
 
     notification_text = " and ".join(notification_reason)
 
-    logger.info(f"Sending Telegram notification: {notification_text}")
+    if bullets is None:
+        bullets = "\n".join("• " + date for date in test_dates)
+
+    logger.info("Sending Telegram notification: %s", notification_text)
 
     try:
-        # Create message text
-        message_text = (
-            f"⚠️ *SAT Test Dates Alert*\n\n"
+        # Collect the message parts and join once instead of growing a
+        # string with repeated concatenation
+        parts = [
+            "⚠️ *SAT Test Dates Alert*\n\n"
             f"{notification_text}\n\n"
-            f"*Current Test Dates:*\n"
-        )
-
-        # Add each test date
-        if test_dates:
-            for date in test_dates:
-                message_text += f"• {date}\n"
-        else:
-            message_text += "No dates found\n"
-
-        # Add check time
-        message_text += f"\n*Check Time:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "*Current Test Dates:*\n",
+            bullets + "\n" if bullets else "No dates found\n",
+            f"\n*Check Time:* {check_time or datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        ]
 
         # Add hash information if available
         if content_hash:
-            message_text += f"*Current Content Hash:* `{content_hash[:10]}...`\n"
+            parts.append(f"*Current Content Hash:* `{content_hash[:10]}...`\n")
 
         if prev_hash and page_changed:
-            message_text += f"*Previous Content Hash:* `{prev_hash[:10]}...`\n"
+            parts.append(f"*Previous Content Hash:* `{prev_hash[:10]}...`\n")
 
-        # Add URL
-        message_text += f"*URL:* {URL}"
+        parts.append(f"*URL:* {URL}")
+        message_text = "".join(parts)
 
         # Telegram Bot API URL
         telegram_url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
@@ -375,78 +505,113 @@ def send_telegram_notification(
             "parse_mode": "Markdown"
         }
 
-        # Send notification with retry logic
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    telegram_url,
-                    json=payload,
-                    timeout=10
-                )
-                response.raise_for_status()
-
-                # Check response from Telegram
-                response_json = response.json()
-                if response_json.get("ok"):
-                    logger.info("Telegram notification sent successfully")
-                    return True
-                else:
-                    error_msg = response_json.get('description', 'Unknown error')
-                    logger.error(f"Telegram API error: {error_msg}")
-
-                    # Don't retry if it's a permanent error like invalid token
-                    if "unauthorized" in error_msg.lower() or "not found" in error_msg.lower():
-                        return False
-
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Retrying Telegram notification...")
-                        time.sleep(2)  # Wait before retry
-                    else:
-                        return False
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"Telegram notification attempt {attempt + 1} failed: {e}. Retrying...")
-                    time.sleep(2)  # Wait before retry
-                else:
-                    logger.error(f"All Telegram notification attempts failed: {e}")
-                    return False
+        # Send notification, retrying on rate limits and transient errors
+        try:
+            response = _post_json(telegram_url, payload)
+        except requests.RequestException as e:
+            logger.error("All Telegram notification attempts failed: %s", e)
+            return False
+
+        # Check response from Telegram
+        response_json = response.json()
+        if response_json.get("ok"):
+            logger.info("Telegram notification sent successfully")
+            return True
+        logger.error("Telegram API error: %s", response_json.get('description', 'Unknown error'))
+        return False
 
     except Exception as e:
-        logger.error(f"Error sending Telegram notification: {e}")
+        logger.error("Error sending Telegram notification: %s", e)
         return False
 
-    return False  # Should not reach here
 
+def next_poll_delay(change_history: List[str]) -> int:
+    """Pick the next poll delay from the observed change cadence.
 
-def main() -> None:
-    """Main function"""
-    logger.info(f"Starting SAT Test Dates monitoring (version 1.2.0)")
-    logger.info(f"Running in GitHub Actions: {os.environ.get('GITHUB_ACTIONS', 'No')}")
+    With enough recorded changes, polling at a fraction of the median
+    inter-change interval keeps detection latency low without burning
+    requests on a page that changes rarely. Falls back to POLL_INTERVAL
+    until there is history to learn from.
+    """
+    if len(change_history) < 3:
+        return max(POLL_INTERVAL, MIN_POLL)
+    try:
+        stamps = sorted(datetime.fromisoformat(ts) for ts in change_history)
+        gaps = sorted(
+            (later - earlier).total_seconds()
+            for earlier, later in zip(stamps, stamps[1:]))
+        median_gap = gaps[len(gaps) // 2]
+        # Poll at a quarter of the median gap: expected detection latency
+        # stays well under one inter-change interval at a quarter of the
+        # request budget of matching the cadence exactly
+        delay = int(median_gap / 4)
+    except (ValueError, TypeError) as e:
+        logger.warning("Could not derive poll delay from change history: %s", e)
+        return max(POLL_INTERVAL, MIN_POLL)
+    return max(MIN_POLL, min(MAX_POLL, delay))
+
+
+def run_once() -> List[str]:
+    """Run a single monitoring pass.
+
+    Returns the updated change history so the polling loop can adapt its
+    cadence to how often the page actually changes.
+    """
+    logger.info("Starting SAT Test Dates monitoring (version 1.2.0)")
+    logger.info("Running in GitHub Actions: %s", os.environ.get('GITHUB_ACTIONS', 'No'))
+
+    # Load previous state first so we can make a conditional request
+    prev_state = load_state()
+    prev_modified = prev_state.get("last_modified") if prev_state else None
+    prev_etag = prev_state.get("etag") if prev_state else None
+    prev_raw_hash = prev_state.get("raw_hash") if prev_state else None
+    change_history = list(prev_state.get("change_history", [])) if prev_state else []
 
     # Fetch the page
-    page_data = fetch_page()
+    page_data = fetch_page(prev_modified=prev_modified, prev_etag=prev_etag,
+                           prev_raw_hash=prev_raw_hash)
 
     if not page_data:
         logger.error("Failed to fetch the page, exiting")
-        return
+        return change_history
+
+    if page_data.get('not_modified'):
+        logger.info("Page unchanged since last check, nothing to do")
+        # Persist rotated validators so the next poll still gets a cheap
+        # 304 / HEAD hit instead of paying a full GET forever
+        new_modified = page_data.get('last_modified')
+        new_etag = page_data.get('etag')
+        if prev_state and ((new_modified and new_modified != prev_modified) or
+                           (new_etag and new_etag != prev_etag)):
+            logger.info("Validators rotated over unchanged body, updating state")
+            save_state(prev_state.get("content_hash"), prev_state.get("test_dates", []),
+                       new_modified or prev_modified, prev_state.get("table_hash"),
+                       datetime.now().isoformat(), change_history,
+                       prev_state.get("content_length"), new_etag or prev_etag,
+                       page_data.get('raw_hash') or prev_raw_hash)
+        return change_history
 
     html_content = page_data['content']
-    content_hash = page_data['content_hash']
 
-    # Extract test dates
-    test_dates = extract_test_dates(html_content)
+    # Skip extraction entirely when the table slice is byte-identical to
+    # the previous run; the stored dates are still valid
+    table_hash = calculate_table_hash(html_content)
+    if table_hash and prev_state and table_hash == prev_state.get("table_hash"):
+        test_dates = list(prev_state.get("test_dates", []))
+        logger.info("Dates table unchanged (hash match), reusing stored test dates")
+    else:
+        test_dates = extract_test_dates(html_content)
 
     if not test_dates:
         logger.warning("No test dates extracted from the page")
         # Continue execution to check if the page changed
 
-    # Load previous state
-    prev_state = load_state()
+    # The change signal is the date list itself, not the page markup
+    content_hash = calculate_dates_hash(test_dates)
 
     # Determine if we need to send notifications
-    should_notify = False
     page_changed = False
+    dates_changed = False
     prev_hash = None
 
     # Check if we have previous state
@@ -454,36 +619,63 @@ def main() -> None:
         # Check if the page has changed since last time based on content hash
         prev_hash_value = prev_state.get("content_hash")
         prev_dates = prev_state.get("test_dates", [])
+        # Dates come out in document order, so a plain list compare is
+        # enough and also catches reorderings a set compare would miss
+        dates_changed = test_dates != prev_dates
 
         if content_hash != prev_hash_value:
             page_changed = True
             prev_hash = prev_hash_value
-            should_notify = True
-            logger.info(f"Page content has changed (hash mismatch)")
-            logger.info(f"Previous hash: {prev_hash_value}")
-            logger.info(f"Current hash: {content_hash}")
-        elif set(test_dates) != set(prev_dates):
+            logger.info("Page content has changed (hash mismatch)")
+            logger.info("Previous hash: %s", prev_hash_value)
+            logger.info("Current hash: %s", content_hash)
+        elif dates_changed:
             # This shouldn't normally happen if hash detection is working properly
             page_changed = True
-            should_notify = True
-            logger.warning(f"Test dates have changed even though content hash didn't change")
+            logger.warning("Test dates have changed even though content hash didn't change")
         else:
             logger.info("Page content and test dates have not changed since last check")
     else:
         # No previous state, this is the first run
         logger.info("First run, no previous state to compare")
         # Don't notify on first run, just establish a baseline
-        should_notify = False
 
-    # Check if the number of test dates exceeds the threshold
     if len(test_dates) > DATE_THRESHOLD:
-        should_notify = True
-        logger.info(f"Found {len(test_dates)} test dates, which exceeds the threshold of {DATE_THRESHOLD}")
+        logger.info("Found %d test dates, which exceeds the threshold of %d", len(test_dates), DATE_THRESHOLD)
+
+    # Only alert when the date list itself differs from the previous run;
+    # a page change with identical dates would just repeat the last alert
+    should_notify = dates_changed and (page_changed or len(test_dates) > DATE_THRESHOLD)
+    if page_changed and not dates_changed:
+        logger.info("Page changed but test dates are identical, skipping duplicate notification")
+
+    # Format the check timestamp once instead of in each notifier and the
+    # state save
+    now = datetime.now()
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+    now_iso = now.isoformat()
+
+    # Both notifiers render the same bullet list; build it once
+    bullets = "\n".join("• " + date for date in test_dates)
+
+    # Record when the date list actually changed so the polling loop
+    # adapts to the signal we care about, not markup churn
+    if dates_changed:
+        change_history.append(now_iso)
+        change_history = change_history[-CHANGE_HISTORY_LIMIT:]
 
     # Send notifications if needed
     if should_notify:
-        discord_result = send_discord_notification(test_dates, page_changed, content_hash, prev_hash)
-        telegram_result = send_telegram_notification(test_dates, page_changed, content_hash, prev_hash)
+        # Discord and Telegram are independent round-trips; send them
+        # concurrently so the notification phase costs max() rather than
+        # sum() of the two latencies
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            discord_future = pool.submit(
+                send_discord_notification, test_dates, page_changed, content_hash, prev_hash, now_str, bullets)
+            telegram_future = pool.submit(
+                send_telegram_notification, test_dates, page_changed, content_hash, prev_hash, now_str, bullets)
+            discord_result = discord_future.result()
+            telegram_result = telegram_future.result()
 
         if discord_result and telegram_result:
             logger.info("All notifications sent successfully")
@@ -496,16 +688,50 @@ def main() -> None:
     else:
         logger.info("No need to send notifications")
 
-    # Save current state
-    save_state(content_hash, test_dates)
+    # Only rewrite the state file when something in it actually changed;
+    # last_check going stale on skipped writes is fine since nothing
+    # reads it programmatically
+    state_changed = prev_state is None or any(
+        prev_state.get(key) != value for key, value in (
+            ("content_hash", content_hash),
+            ("test_dates", test_dates),
+            ("last_modified", page_data.get('last_modified')),
+            ("table_hash", table_hash),
+            ("change_history", change_history),
+            ("content_length", page_data.get('content_length')),
+            ("etag", page_data.get('etag')),
+            ("raw_hash", page_data.get('raw_hash')),
+        ))
+    if state_changed:
+        save_state(content_hash, test_dates, page_data.get('last_modified'), table_hash, now_iso,
+                   change_history, page_data.get('content_length'), page_data.get('etag'),
+                   page_data.get('raw_hash'))
+    else:
+        logger.info("State unchanged, skipping state file write")
 
     logger.info("Monitoring completed successfully")
+    return change_history
+
+
+def main() -> None:
+    """Main function.
+
+    Runs one pass by default; with POLL_INTERVAL set, keeps polling in a
+    loop so Python startup, imports and the connection pool are paid once
+    instead of per poll.
+    """
+    change_history = run_once()
+    while POLL_INTERVAL > 0:
+        delay = next_poll_delay(change_history)
+        logger.info("Sleeping %d seconds until next poll", delay)
+        time.sleep(delay)
+        change_history = run_once()
 
 
 if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logger.critical(f"Unhandled exception in main function: {e}", exc_info=True)
+        logger.critical("Unhandled exception in main function: %s", e, exc_info=True)
         # Exit with error code for GitHub Actions to mark the step as failed
         exit(1)
\ No newline at end of file